@@ -53,8 +53,8 @@ def user_choice_character_grouping(list_of_strings: list) -> dict[str, list[str]
 
     type_check(value=list_of_strings, required_type=list, tb_remove_name="user_choice_character_grouping")
 
-    formatted_list_of_strings = "  - list_of_strings (list):" + str(
-        "\n        - " + "\n        - ".join(map(str, list_of_strings))
+    formatted_list_of_strings = "  - list_of_strings (list):\n        - " + "\n        - ".join(
+        map(str, list_of_strings)
     )
     logger.debug("Passing parameters:\n" f"{formatted_list_of_strings}\n")
 
@@ -49,8 +49,8 @@ def common_case_isupper(list_of_strings: list[str]) -> bool:
 
     type_check(value=list_of_strings, required_type=list, tb_remove_name="common_case_isupper")
 
-    formatted_list_of_strings = "  - list_of_strings (list):" + str(
-        "\n        - " + "\n        - ".join(map(str, list_of_strings))
+    formatted_list_of_strings = "  - list_of_strings (list):\n        - " + "\n        - ".join(
+        map(str, list_of_strings)
     )
     logger.debug("Passing parameters:\n" f"{formatted_list_of_strings}\n")
 
@@ -110,8 +110,8 @@ def common_case_islower(list_of_strings: list[str]) -> bool:
 
     type_check(value=list_of_strings, required_type=list, tb_remove_name="common_case_islower")
 
-    formatted_list_of_strings = "  - list_of_strings (list):" + str(
-        "\n        - " + "\n        - ".join(map(str, list_of_strings))
+    formatted_list_of_strings = "  - list_of_strings (list):\n        - " + "\n        - ".join(
+        map(str, list_of_strings)
     )
     logger.debug("Passing parameters:\n" f"{formatted_list_of_strings}\n")
 
@@ -84,15 +84,12 @@ def create_dataclass(
 
     formatted_my_dict: Union[str, None] = None
     if isinstance(my_dict, list):
-        formatted_my_dict = "  - my_dict (list):" + str("\n        - " + "\n        - ".join(map(str, my_dict)))
+        formatted_my_dict = "  - my_dict (list):\n        - " + "\n        - ".join(map(str, my_dict))
     if isinstance(my_dict, dict):
         formatted_my_dict = "  - my_dict (dict):\n        - " + "\n        - ".join(
             ": ".join((key, str(val))) for (key, val) in my_dict.items()
         )
-    if req_keys:
-        formatted_req_keys = f"  - req_keys (set):\n        - {req_keys}"
-    else:
-        formatted_req_keys = f"  - req_keys (set):\n        - None"
+    formatted_req_keys = f"  - req_keys (set):\n        - {req_keys or None}"
     logger.debug(
         "Passing parameters:\n"
         f"  - dataclass_name (str):\n        - {dataclass_name}\n"
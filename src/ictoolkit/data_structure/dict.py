@@ -1,6 +1,6 @@
 # Built-in/Generic Imports
 import logging
-from itertools import groupby
+from collections import defaultdict
 from typing import Literal, Union, Any
 
 # Libraries
@@ -16,7 +16,7 @@ from ..data_structure.list import sort_list
 from ..data_structure.exceptions import DictStructureFailure
 
 # Exceptions
-from fexception import FTypeError, FCustomException
+from fexception import FTypeError, FValueError, FCustomException
 
 
 __author__ = "IncognitoCoding"
@@ -206,6 +206,24 @@ def sort_dict(my_dict: dict[Any, Any], sort: Literal["key", "value"], sort_value
     return sorted_dict
 
 
+def _common_prefix_length(string: str, compare_string: str, case_insensitive: bool) -> int:
+    """
+    Returns the number of leading characters that match between two strings.
+
+    Each character is compared with casefold() when case_insensitive is enabled.
+    """
+    if case_insensitive:
+        character_pairs = zip(map(str.casefold, string), map(str.casefold, compare_string))
+    else:
+        character_pairs = zip(string, compare_string)
+    character_match_count = 0
+    for character, compare_character in character_pairs:
+        if character != compare_character:
+            break
+        character_match_count += 1
+    return character_match_count
+
+
 def string_grouper(
     list_of_strings: list[str],
     grouping_option: int,
@@ -273,6 +291,8 @@ def string_grouper(
         \t\\- The grouping_value sent for the grouping is not a string.
         FTypeError (fexception):
         \t\\- The grouping_value sent for the grouping is not a int.
+        FValueError (fexception):
+        \t\\- The grouping_value sent for the grouping is less than 1.
 
     Returns:
         dict[str, list[str]]:\\
@@ -298,63 +318,54 @@ def string_grouper(
     type_check(value=grouping_option, required_type=int, tb_remove_name="string_grouper")
     type_check(value=case_insensitive, required_type=bool, tb_remove_name="string_grouper")
 
-    formatted_list_of_strings = "  - list_of_strings (list):" + str(
-        "\n        - " + "\n        - ".join(map(str, list_of_strings))
-    )
-    if grouping_value:
-        formatted_grouping_value = f"  - grouping_value (str or int or None):\n        - {grouping_value}"
-    else:
-        formatted_grouping_value = f"  - grouping_value (str or int or None):\n        - None"
+    # Skips building the parameter output when debug logging is disabled.
+    if logger.isEnabledFor(logging.DEBUG):
+        formatted_list_of_strings = "  - list_of_strings (list):\n        - " + "\n        - ".join(
+            map(str, list_of_strings)
+        )
+        formatted_grouping_value = f"  - grouping_value (str or int or None):\n        - {grouping_value or None}"
 
-    logger.debug(
-        "Passing parameters:\n"
-        f"{formatted_list_of_strings}\n"
-        f"{formatted_grouping_value}\n"
-        f"  - grouping_option (int):\n        - {grouping_option}\n"
-        f"  - case_insensitive (bool):\n        - {case_insensitive}\n"
-    )
+        logger.debug(
+            "Passing parameters:\n"
+            f"{formatted_list_of_strings}\n"
+            f"{formatted_grouping_value}\n"
+            f"  - grouping_option (int):\n        - {grouping_option}\n"
+            f"  - case_insensitive (bool):\n        - {case_insensitive}\n"
+        )
 
-    logger.debug(f"Starting string grouping with the following list of strings: {list_of_strings}")
+        logger.debug(f"Starting string grouping with the following list of strings: {list_of_strings}")
 
     # Checks if any "None" entries exist.
     if None in list_of_strings:
         logger.debug(f'The list of strings contains "None" string entries. The "None" entries have been removed')
         # Removes any "None" entries from the list.
-        list_of_strings = list(filter(None, list_of_strings))
+        # Empty strings are kept, so the output matches a list that never contained "None" entries.
+        list_of_strings = [a_string for a_string in list_of_strings if a_string is not None]
     # Make sure that the list is greater than or equal to 2.
     if len(list_of_strings) >= 2:
         # Holds grouped values from the list.
         grouping: dict[str, list[str]] = {}
-
-        # Sorts with case-insensitive.
-        if case_insensitive:
-            list_of_strings = sorted(list_of_strings, key=lambda s: s.casefold())
-        else:
-            list_of_strings = sorted(list_of_strings)
+        # Holds each grouping bucket for options 1 and 2. The key is the split output, and the value is the list of strings in the grouping.
+        # The buckets are keyed directly, so the list does not need to be sorted before grouping.
+        grouping_buckets: defaultdict[str, list[str]] = defaultdict(list)
 
         # Groups based on the user's group option.
         if grouping_option == 1:
             # This section will group based on a character. If the string is "Testing-1" and the matching character was -, the grouping values would match on "Testing".
             # Checks that the grouping_value is a string.
             if isinstance(grouping_value, str):
-                # Loops through a list of strings and splits based on the split number. The split number will create a grouping, and provide the split output for each grouping.
+                # Loops through a list of strings and splits based on the grouping character. The split will create a grouping, and provide the split output for each grouping.
                 if case_insensitive:
                     if common_case_isupper(list_of_strings=list_of_strings):
-                        for j, i in groupby(
-                            list_of_strings, lambda a_string: a_string.upper().split(grouping_value)[0]
-                        ):
-                            # Appends the grouping from groupby to the list in in dictionary format.
-                            grouping.update({j: list(i)})
+                        for a_string in list_of_strings:
+                            grouping_buckets[a_string.upper().partition(grouping_value)[0]].append(a_string)
                     elif common_case_islower(list_of_strings=list_of_strings):
-                        for j, i in groupby(
-                            list_of_strings, lambda a_string: a_string.lower().split(grouping_value)[0]
-                        ):
-                            # Appends the grouping from groupby to the list in in dictionary format.
-                            grouping.update({j: list(i)})
+                        for a_string in list_of_strings:
+                            grouping_buckets[a_string.lower().partition(grouping_value)[0]].append(a_string)
                 else:
-                    for j, i in groupby(list_of_strings, lambda a_string: a_string.split(grouping_value)[0]):
-                        # Appends the grouping from groupby to the list in in dictionary format.
-                        grouping.update({j: list(i)})
+                    for a_string in list_of_strings:
+                        grouping_buckets[a_string.partition(grouping_value)[0]].append(a_string)
+                grouping.update(grouping_buckets)
             else:
                 exc_args = {
                     "main_message": "The grouping_value sent for the grouping is not a string.",
@@ -367,38 +378,26 @@ def string_grouper(
             # Checks that the grouping_value is a number.
             if isinstance(grouping_value, int):
                 group_number: int = grouping_value
-                # Loops through a list of strings and splits based on the split number. The split number will create a grouping, and provide the split output for each grouping.
+                # Checks that the grouping_value can slice at least one character.
+                if group_number < 1:
+                    exc_args = {
+                        "main_message": "The grouping_value sent for the grouping is less than 1.",
+                        "expected_result": "An int greater than or equal to 1",
+                        "returned_result": str(group_number),
+                    }
+                    raise FValueError(message_args=exc_args, tb_remove_name="string_grouper")
+                # Loops through a list of strings and slices the leading characters based on the split number. The leading characters will create a grouping.
                 if case_insensitive:
                     if common_case_isupper(list_of_strings=list_of_strings):
-                        for j, i in groupby(
-                            list_of_strings,
-                            lambda a_string: [
-                                str(a_string[index : index + group_number]).upper()
-                                for index in range(0, len(a_string), group_number)
-                            ][0],
-                        ):
-                            # Appends the grouping from groupby to the list in in dictionary format.
-                            grouping.update({j: list(i)})
+                        for a_string in list_of_strings:
+                            grouping_buckets[a_string[:group_number].upper()].append(a_string)
                     elif common_case_islower(list_of_strings=list_of_strings):
-                        for j, i in groupby(
-                            list_of_strings,
-                            lambda a_string: [
-                                str(a_string[index : index + group_number]).lower()
-                                for index in range(0, len(a_string), group_number)
-                            ][0],
-                        ):
-                            # Appends the grouping from groupby to the list in in dictionary format.
-                            grouping.update({j: list(i)})
+                        for a_string in list_of_strings:
+                            grouping_buckets[a_string[:group_number].lower()].append(a_string)
                 else:
-                    for j, i in groupby(
-                        list_of_strings,
-                        lambda a_string: [
-                            str(a_string[index : index + group_number])
-                            for index in range(0, len(a_string), group_number)
-                        ][0],
-                    ):
-                        # Appends the grouping from groupby to the list in in dictionary format.
-                        grouping.update({j: list(i)})
+                    for a_string in list_of_strings:
+                        grouping_buckets[a_string[:group_number]].append(a_string)
+                grouping.update(grouping_buckets)
             else:
                 exc_args = {
                     "main_message": "The grouping_value sent for the grouping is not a int.",
@@ -407,181 +406,146 @@ def string_grouper(
                 }
                 raise FTypeError(message_args=exc_args, tb_remove_name="string_grouper")
         elif grouping_option == 3:
+            # Sorts with case-insensitive.
+            # The comparison below requires the strings in alphabetical order.
+            if case_insensitive:
+                list_of_strings = sorted(list_of_strings, key=lambda s: s.casefold())
+            else:
+                list_of_strings = sorted(list_of_strings)
+
             # This comparison can have some complex checks because it has to check previous entries and make choices based on previous and current groupings.
-            # The section of code is split into two different loops. The primary loop goes through each string. The sub-string loops and checks character by character
-            # between the previous string and current string.
+            # The primary loop goes through each string. The matching characters between the current string and the next string are counted once,
+            # and the grouping choice is made from the count.
             # All processing is done with the mindset that the current entry is always compared with the previous entry. The comparison is based on alphabetical order.
             # Loops through all raw string imports to compare.
             for raw_string_loop_tracker, string in enumerate(list_of_strings):
                 # Checks if the length of the raw string is equal to the raw_string_loop_tracker + 1. This allows a clean exit without the list going out of the index.
                 if len(list_of_strings) != raw_string_loop_tracker + 1:
-                    logger.debug(f'Comparing "{string}" with "{list_of_strings[raw_string_loop_tracker + 1]}"')
-                    # Loops through each character in the main string entry.
-                    for character_loop_tracker, character in enumerate(string):
-                        logger.debug(f"Checking character position {character_loop_tracker}")
-
-                        # Checks if case adjustment needs to be applied.
-                        next_raw_value: str
+                    # Gets the next raw string in the list once for the comparison.
+                    # + 1 so the first string entry will compare with this starting entry.
+                    next_string: str = list_of_strings[raw_string_loop_tracker + 1]
+                    logger.debug('Comparing "%s" with "%s"', string, next_string)
+                    # Gets the number of leading characters that match between the main string and the next raw string in the list.
+                    character_match_count: int = _common_prefix_length(
+                        string=string,
+                        compare_string=next_string,
+                        case_insensitive=case_insensitive,
+                    )
+                    logger.debug("Matched %d characters", character_match_count)
+
+                    # No match before the end of the main string.
+                    if character_match_count < len(string):
+                        logger.debug("No Match at character position %d", character_match_count)
+
+                        # Case insensitive is supported in this function. Two different variables
+                        # needs set to check character matches and set values.
+                        # Used for comparing characters.
+                        match_characters_check: str
                         if case_insensitive:
-                            character = character.casefold()
-                            next_raw_value = list_of_strings[raw_string_loop_tracker + 1][
-                                character_loop_tracker
-                            ].casefold()
+                            match_characters_check = string[0:character_match_count].casefold()
                         else:
-                            next_raw_value = list_of_strings[raw_string_loop_tracker + 1][character_loop_tracker]
-
-                        # Checks if the character from the main entry matches the character in the next raw string in the list.
-                        # + 1 so the first string entry will compare with this starting entry.
-                        if character == next_raw_value:
-                            logger.debug(f"Match at character position {character_loop_tracker}")
-                        # No match
-                        elif character != next_raw_value:
-                            logger.debug(f"No Match at character position {character_loop_tracker}")
-
-                            # Case insensitive is supported in this function. Two different variables
-                            # needs set to check character matches and set values.
-                            # Used for comparing characters. Character get starts at 1, so need to -1.
-                            match_characters_check: str
-                            if case_insensitive:
-                                match_characters_check = string[0:character_loop_tracker].casefold()
+                            match_characters_check = string[0:character_match_count]
+
+                        # Sets the match characters.
+                        match_characters_set = string[0:character_match_count]
+
+                        logger.debug("Matched characters = %s", match_characters_check)
+                        if match_characters_set:
+                            # Checks if no groupings have been added.
+                            if not grouping:
+                                # Adds the initial grouping.
+                                grouping[match_characters_set] = [string, next_string]
                             else:
-                                match_characters_check = string[0:character_loop_tracker]
-
-                            # Sets the match characters.
-                            match_characters_set = string[0:character_loop_tracker]
-
-                            logger.debug(f"Matched characters = {match_characters_check}")
-                            if match_characters_set:
-                                # Checks if no groupings have been added.
-                                if not grouping:
-                                    # Adds the initial grouping.
-                                    grouping.update(
-                                        {
-                                            match_characters_set: [
-                                                string,
-                                                list_of_strings[raw_string_loop_tracker + 1],
-                                            ]
-                                        }
-                                    )
+                                # Gets the previous grouping identifier key.
+                                # The dict keeps insertion order, so the last key is read from the reversed dict without copying every key.
+                                previous_group_key_set: str = next(reversed(grouping))
+                                # Gets the previous grouping value.
+                                previous_group_values: list[str] = grouping[previous_group_key_set]
+
+                                # Case insensitive is supported in this function. Two different variables
+                                # needs set to check character matches and set values.
+                                # Used for comparing characters.
+                                previous_group_key_check: str
+                                if case_insensitive:
+                                    previous_group_key_check = previous_group_key_set.casefold()
                                 else:
-                                    # Case insensitive is supported in this function. Two different variables
-                                    # needs set to check character matches and set values.
-                                    # Used for comparing characters. The character starts at 1, so needs to be -1.
-                                    previous_group_key_check: str
-                                    if case_insensitive:
-                                        previous_group_key_check = list(grouping.keys())[-1].casefold()
-                                    else:
-                                        previous_group_key_check = list(grouping.keys())[-1]
-
-                                    # Gets the previous grouping identifier key.
-                                    previous_group_key_set: str = list(grouping.keys())[-1]
-                                    # Gets the previous grouping value.
-                                    previous_group_values: list[str] = list(grouping.values())[-1]
+                                    previous_group_key_check = previous_group_key_set
+
+                                # Checks if the previous grouping identifier is the same, so the string can be joined into the same group entry.
+                                if match_characters_check == previous_group_key_check:
+                                    logger.debug(
+                                        "Previous grouping matches. %s = %s",
+                                        previous_group_key_check,
+                                        match_characters_check,
+                                    )
 
-                                    # Checks if the previous grouping identifier is the same, so the string can be joined into the same group entry.
-                                    if match_characters_check == previous_group_key_check:
+                                    # The previous grouping list is updated in place.
+                                    previous_group_values.append(next_string)
+                                else:
+                                    # Checks if a single string entry. This is required because a single string entry will have the same group_identifier name as the string until the next entry is matched.
+                                    if len(previous_group_values) == 1:
                                         logger.debug(
-                                            f"Previous grouping matches. {previous_group_key_check} = {match_characters_check}"
+                                            'Previous grouping is a single entry and has matching characters. "%s" in "%s"',
+                                            match_characters_check,
+                                            previous_group_key_check,
                                         )
+                                        # Checks if the current match_characters are in the previous_group_keys name.
+                                        # Note: The previous_group_keys name will be the full name of the string, so the match has to be the other way for detection.
+                                        if match_characters_check in previous_group_key_check:
+                                            logger.debug("Merging previous entry with the current entry")
 
-                                        previous_group_values.append(list_of_strings[raw_string_loop_tracker + 1])
-                                        grouping[previous_group_key_set] = previous_group_values
-                                    else:
-                                        # Checks if a single string entry. This is required because a single string entry will have the same group_identifier name as the string until the next entry is matched.
-                                        if len(previous_group_values) == 1:
-                                            logger.debug(
-                                                f'Previous grouping is a single entry and has matching characters. "{match_characters_check}" in "{previous_group_key_check}"'
-                                            )
-                                            # Checks if the current match_characters are in the previous_group_keys name.
-                                            # Note: The previous_group_keys name will be the full name of the string, so the match has to be the other way for detection.
-                                            if match_characters_check in previous_group_key_check:
-                                                logger.debug("Merging previous entry with the current entry")
-
-                                                # Removes the previous group entry because it will not be merged with the current string group.
-                                                grouping.pop(previous_group_key_set)
-
-                                                # grouping.remove(grouping[-1])
-                                                # Adds the new grouping to the list with the previous group added as well.
-                                                grouping.update(
-                                                    {
-                                                        match_characters_set: [
-                                                            "".join(previous_group_values),
-                                                            list_of_strings[raw_string_loop_tracker + 1],
-                                                        ],
-                                                    }
-                                                )
-                                            else:
-                                                logger.debug(
-                                                    f"Previous grouping do not match. {previous_group_key_check} != {match_characters_check}"
-                                                )
-                                                # Adds the new grouping to the list.
-                                                grouping.update(
-                                                    {
-                                                        match_characters_set: [
-                                                            list_of_strings[raw_string_loop_tracker + 1]
-                                                        ],
-                                                    }
-                                                )
-                                        # Compares the previous group to the match to make sure the groupings are the same. The previous_grouping_identifier could contain more characters than the current match, so this flow is required.
-                                        elif str(previous_group_key_check) in str(match_characters_check):
-                                            logger.debug(
-                                                f'Previous grouping has multiple strings grouped and the group_identifier has the same characters as the match group. "{match_characters_check}" in "{previous_group_key_check}"'
-                                            )
+                                            # Removes the previous group entry because it will not be merged with the current string group.
+                                            grouping.pop(previous_group_key_set)
 
-                                            previous_group_values.append(list_of_strings[raw_string_loop_tracker + 1])
-                                            grouping[previous_group_key_set] = previous_group_values
+                                            # Adds the new grouping to the list with the previous group added as well.
+                                            # The previous grouping is a single entry, so the entry is used directly.
+                                            grouping[match_characters_set] = [previous_group_values[0], next_string]
                                         else:
                                             logger.debug(
-                                                f"Previous grouping do not match. {previous_group_key_check} != {match_characters_check}"
+                                                "Previous grouping do not match. %s != %s",
+                                                previous_group_key_check,
+                                                match_characters_check,
                                             )
-                                            # No match occurred with the previous entry, which means this entry is completely new, so the "group_identifier" will be the name of the string. This will adjust if the next string has a match.
-                                            # Note: If no match is made the group_identifier will always be the name of the string because it had nothing to compare itself against.
                                             # Adds the new grouping to the list.
-                                            grouping.update(
-                                                {
-                                                    list_of_strings[raw_string_loop_tracker + 1]: [
-                                                        list_of_strings[raw_string_loop_tracker + 1]
-                                                    ],
-                                                }
-                                            )
+                                            grouping[match_characters_set] = [next_string]
+                                    # Compares the previous group to the match to make sure the groupings are the same. The previous_grouping_identifier could contain more characters than the current match, so this flow is required.
+                                    elif str(previous_group_key_check) in str(match_characters_check):
+                                        logger.debug(
+                                            'Previous grouping has multiple strings grouped and the group_identifier has the same characters as the match group. "%s" in "%s"',
+                                            match_characters_check,
+                                            previous_group_key_check,
+                                        )
+
+                                        # The previous grouping list is updated in place.
+                                        previous_group_values.append(next_string)
+                                    else:
+                                        logger.debug(
+                                            "Previous grouping do not match. %s != %s",
+                                            previous_group_key_check,
+                                            match_characters_check,
+                                        )
+                                        # No match occurred with the previous entry, which means this entry is completely new, so the "group_identifier" will be the name of the string. This will adjust if the next string has a match.
+                                        # Note: If no match is made the group_identifier will always be the name of the string because it had nothing to compare itself against.
+                                        # Adds the new grouping to the list.
+                                        grouping[next_string] = [next_string]
+                        else:
+                            logger.debug("No Matching Characters Found")
+
+                            # Checks if entries have been added to the list. No entries mean the starting entry needs to be added.
+                            if not grouping:
+                                # Adds the starting entry and the next entry because neither of these entries matched on startup.
+                                grouping[string] = [string]
+                                grouping[next_string] = [next_string]
                             else:
-                                logger.debug("No Matching Characters Found")
-
-                                # Checks if entries have been added to the list. No entries mean the starting entry needs to be added.
-                                if not grouping:
-                                    # Adds the starting entry and the next entry because neither of these entries matched on startup.
-                                    grouping.update({string: [string]})
-                                    grouping.update(
-                                        {
-                                            list_of_strings[raw_string_loop_tracker + 1]: [
-                                                list_of_strings[raw_string_loop_tracker + 1]
-                                            ],
-                                        }
-                                    )
-                                else:
-                                    # Note: If no match is made the group_identifier will always be the name of the string because it had nothing to compare itself against.
-                                    # Adds the new grouping to the list.
-                                    grouping.update(
-                                        {
-                                            list_of_strings[raw_string_loop_tracker + 1]: [
-                                                list_of_strings[raw_string_loop_tracker + 1]
-                                            ],
-                                        }
-                                    )
-                            # Breaks the lop because no additional characters match.
-                            break
-
-                        # Checks if the main string is shorter than the main string. This means no match occurred, so the group_identifier for this entry is main entry.
-                        if character_loop_tracker == len(string) - 1:
-                            logger.debug("Compare string is longer than the main string")
-                            grouping.update({string: [string]})
-                            grouping.update(
-                                {
-                                    list_of_strings[raw_string_loop_tracker + 1]: [
-                                        list_of_strings[raw_string_loop_tracker + 1]
-                                    ],
-                                }
-                            )
+                                # Note: If no match is made the group_identifier will always be the name of the string because it had nothing to compare itself against.
+                                # Adds the new grouping to the list.
+                                grouping[next_string] = [next_string]
+                    # Checks if the main string is shorter than the compare string. This means no match occurred, so the group_identifier for this entry is main entry.
+                    # An empty main string has no characters to compare, so no grouping is added.
+                    elif string:
+                        logger.debug("Compare string is longer than the main string")
+                        grouping[string] = [string]
+                        grouping[next_string] = [next_string]
 
         # Sorts the group keys, and values list.
         # Sorts with case-insensitive.
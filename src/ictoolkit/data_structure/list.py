@@ -1,6 +1,8 @@
 # Built-in/Generic Imports
 import logging
-from typing import Union, List, Any, Optional
+from collections import defaultdict
+from operator import itemgetter
+from typing import Union, List, Any, Optional, Callable
 
 # Libraries
 from fchecker.type import type_check
@@ -176,18 +178,19 @@ def str_to_list(
     if exclude:
         type_check(value=exclude, required_type=str, tb_remove_name="str_to_list")
 
-    if isinstance(value, str):
-        formatted_value = f"  - string (str):\n        - {value}\n"
-    else:
-        formatted_value = "  - value (list):" + str("\n        - " + "\n        - ".join(map(str, value)))
-
-    logger.debug(
-        "Passing parameters:\n"
-        f"{formatted_value}\n"
-        f"  - sep (str):\n        - {sep}\n"
-        f"  - remove_whitespace (bool):\n        - {remove_whitespace}\n"
-        f"  - exclude (str):\n        - {exclude}\n"
-    )
+    # Skips building the parameter output when debug logging is disabled.
+    if logger.isEnabledFor(logging.DEBUG):
+        if isinstance(value, str):
+            formatted_value = f"  - string (str):\n        - {value}\n"
+        else:
+            formatted_value = "  - value (list):\n        - " + "\n        - ".join(map(str, value))
+        logger.debug(
+            "Passing parameters:\n"
+            f"{formatted_value}\n"
+            f"  - sep (str):\n        - {sep}\n"
+            f"  - remove_whitespace (bool):\n        - {remove_whitespace}\n"
+            f"  - exclude (str):\n        - {exclude}\n"
+        )
 
     if exclude:
         # Checks that only one exclude character was sent.
@@ -311,54 +314,78 @@ def remove_duplicate_dict_values_in_list(list_dictionary: List[dict], element_nu
     logger_flowchart.debug(f"Flowchart --> Function: {get_function_name()}")
 
     type_check(value=list_dictionary, required_type=list, tb_remove_name="remove_duplicate_dict_values_in_list")
-    if element_number:
+    if element_number is not None:
         type_check(value=element_number, required_type=int, tb_remove_name="remove_duplicate_dict_values_in_list")
 
-    formatted_list_dictionary = "  - list_dictionary (list):" + str(
-        "\n        - " + "\n        - ".join(map(str, list_dictionary))
-    )
-    if element_number:
+    # Skips building the parameter output when debug logging is disabled.
+    if logger.isEnabledFor(logging.DEBUG):
+        formatted_list_dictionary = "  - list_dictionary (list):\n        - " + "\n        - ".join(
+            map(str, list_dictionary)
+        )
         formatted_element_number = f"  - element_number (int):\n        - {element_number}"
-    else:
-        formatted_element_number = f"  - element_number (int):\n        - None"
-    logger.debug("Passing parameters:\n" f"{formatted_list_dictionary}\n" f"{formatted_element_number}\n")
+        logger.debug("Passing parameters:\n" f"{formatted_list_dictionary}\n" f"{formatted_element_number}\n")
+
+    # Checks if section number is being used for matching or a full match is being used.
+    if element_number is None:
+        # Stores the first dictionary found for each set of dictionary items.
+        # The dict keeps the order the dictionaries were found, so no separate revised list is required.
+        unique_dictionaries: dict[frozenset, dict] = {}
+        # Loops through each dictionary in the list
+        for dictionary_in_list in list_dictionary:
+            # Used frozenset because it can be hashed, which allows removal using a dict key.
+            # A frozenset compares without ordering, so no sort is required to match dictionaries with different key history.
+            # setdefault only adds the dictionary when the items do not match a previous entry.
+            unique_dictionaries.setdefault(frozenset(dictionary_in_list.items()), dictionary_in_list)
+        return list(unique_dictionaries.values())
 
     # Holds temporary found elements for comparison.
-    element_found = set()
+    element_found: set[Any] = set()
     # Stores the revised list that does not contain any duplicates.
-    revised_list = []
+    revised_list: list[dict] = []
+    # Binds the set add and list append once instead of looking them up on every loop.
+    add_element_found = element_found.add
+    append_revised_list = revised_list.append
 
     # Loops through each dictionary in the list
     for dictionary_in_list in list_dictionary:
-        # Checks if section number is being used for matching or a full match is being used.
-        if element_number is None:
-            # Used tuple because it can be hashed, which allows removal using set.
-            # This will convert the dictionaries in the list to tuples that contain the dictionaries.
-            # Sorted is added to help with any possible match issues while adding/removing lots of key history.
-            items_of_dictionary = tuple(sorted(dictionary_in_list.items()))
-            # Checks if dictionary entry matches previous entries.
-            if items_of_dictionary not in element_found:
-                # New element found and adding to set.
-                element_found.add(items_of_dictionary)
-
-                # Adds the full dictionary_in_list to the list because it is not a duplicate.
-                revised_list.append(dictionary_in_list)
-        elif element_number:
-            # Used tuple because it can be hashed, which allows removal using set.
-            # This will convert the dictionaries in the list to tuples that contain the dictionaries.
-            # No sort is added here because sort will break the element number order.
-            items_of_dictionary = tuple(dictionary_in_list.items())
-            # Checks if dictionary element section does not match previous entries.
-            if items_of_dictionary[element_number] not in element_found:
-                # New element found and adding to set.
-                element_found.add(items_of_dictionary[element_number])
-
-                # Adds the full dictionary_in_list to the list because it is not a duplicate.
-                revised_list.append(dictionary_in_list)
+        # Used tuple because it can be hashed, which allows removal using set.
+        # This will convert the dictionaries in the list to tuples that contain the dictionaries.
+        # No sort is added here because sort will break the element number order.
+        element_item = tuple(dictionary_in_list.items())[element_number]
+        # Checks if dictionary element section does not match previous entries.
+        if element_item not in element_found:
+            # New element found and adding to set.
+            add_element_found(element_item)
+
+            # Adds the full dictionary_in_list to the list because it is not a duplicate.
+            append_revised_list(dictionary_in_list)
 
     return revised_list
 
 
+def _list_entry_key(entry: Union[list, tuple]) -> tuple:
+    """
+    Returns a hashable matching key for a list or tuple entry.
+
+    The entry type is kept with the items, so a list and a tuple with the same items do not match.
+    """
+    return (type(entry), tuple(entry))
+
+
+def _get_unhashable_indexes(unhashable_value_indexes: list[tuple[Any, list[int]]], value: Any) -> list[int]:
+    """
+    Returns the index points list for a value that can not be hashed (ex: dict).
+
+    The value is matched by equality. A new index points list is added when no previous value matches.
+    """
+    for unhashable_value, indexes in unhashable_value_indexes:
+        if unhashable_value == value:
+            return indexes
+    indexes = []
+    unhashable_value_indexes.append((value, indexes))
+    return indexes
+
+
 def get_list_of_dicts_duplicates(
     key: str, list_dictionary: List[dict], grouped: bool = False
 ) -> Union[list, dict, None]:
@@ -435,48 +462,42 @@ def get_list_of_dicts_duplicates(
     type_check(value=list_dictionary, required_type=list, tb_remove_name="get_list_of_dicts_duplicates")
     type_check(value=grouped, required_type=bool, tb_remove_name="get_list_of_dicts_duplicates")
 
-    formatted_list_dictionary = "  - list_dictionary (list):" + str(
-        "\n        - " + "\n        - ".join(map(str, list_dictionary))
-    )
-    logger.debug(
-        "Passing parameters:\n"
-        f"  - key (int):\n        - {key}\n"
-        f"{formatted_list_dictionary}\n"
-        f"  - grouped (bool):\n        - {grouped}\n"
-    )
+    # Skips building the parameter output when debug logging is disabled.
+    if logger.isEnabledFor(logging.DEBUG):
+        formatted_list_dictionary = "  - list_dictionary (list):\n        - " + "\n        - ".join(
+            map(str, list_dictionary)
+        )
+        logger.debug(
+            "Passing parameters:\n"
+            f"  - key (int):\n        - {key}\n"
+            f"{formatted_list_dictionary}\n"
+            f"  - grouped (bool):\n        - {grouped}\n"
+        )
 
     try:
-        # Temporary storage for unique items.
-        temp_unique_items = []
+        # Stores every index point for each value.
+        # The key is the value from the list and the value is the list of index points.
+        value_indexes: defaultdict[Any, list[int]] = defaultdict(list)
+        # Stores the index points for values that can not be hashed (ex: dict).
+        unhashable_value_indexes: list[tuple[Any, list[int]]] = []
+        # Stores the index points of each duplicate in the order the duplicate was discovered.
+        duplicate_indexes: list[list[int]] = []
+        # Loops through all values of the key once.
+        for index, entry in enumerate(map(itemgetter(key), list_dictionary)):
+            try:
+                indexes = value_indexes[entry]
+            except TypeError:
+                indexes = _get_unhashable_indexes(unhashable_value_indexes, entry)
+            indexes.append(index)
+            # The second index point means the value is a duplicate.
+            if len(indexes) == 2:
+                duplicate_indexes.append(indexes)
+
         # Stores duplicate list entries as dictionaries.
         # The key is the duplicate from the list and the value is the index.
-        duplicate_list_dictionary = []
-        # Gets values of the keys.
-        duplicates_of_key = [my_dict[key] for my_dict in list_dictionary]
-
-        # Loops through all values.
-        for entry in duplicates_of_key:
-            # Checks if the entry from the list exists in the "temp_unique_items" list. If not it gets added to the temp list.
-            # If the entry exists the entry will hit the elif statement and get all index points for the duplicates.
-            if entry not in temp_unique_items:
-                # Adds the entry to the list.
-                temp_unique_items.append(entry)
-            # Checks if the duplicate entry already exists in the duplicate_list_dictionary list.
-            # This has to check if the 'duplicate_list_dictionary' is empty and if the duplicate list does not contain the entry.
-            # The two different "entry" searches are required in case the key is a string or an INT. A string would have a single quote and an INT would not.
-            elif (
-                bool(duplicate_list_dictionary) is False
-                or f"'value': {entry}" not in str(duplicate_list_dictionary)
-                and f"'value': '{entry}'" not in str(duplicate_list_dictionary)
-            ):
-                # Loops through all entries in the list.
-                for index, value in enumerate(duplicates_of_key):
-                    # Checks if the value from the list is equal to the discovered duplicate.
-                    if value == entry:
-                        # Adds the duplicate entry values and index
-                        # The value will be the key and the index will be the value.
-                        # This will allow the ease if finding all index points for a specific value.
-                        duplicate_list_dictionary.append({"index": index, "value": value})
+        duplicate_list_dictionary = [
+            {"index": index, "value": list_dictionary[index][key]} for indexes in duplicate_indexes for index in indexes
+        ]
     except KeyError:  # pragma: no cover
         exc_args = {
             "main_message": "A failure occurred getting duplicate values the list.",
@@ -491,15 +512,14 @@ def get_list_of_dicts_duplicates(
             # Checks if the user enabled grouping.
             if grouped:
                 # Stores new grouped entries
-                grouped_entries: dict[str, list[Any]] = {}
+                grouped_entries: defaultdict[str, list[Any]] = defaultdict(list)
                 # Loops through each grouped entry.
                 for entry in duplicate_list_dictionary:
                     # Gets matching entries based on the "value" key and adds them to the grouped dictionary.
-                    grouped_entries[entry["value"]] = grouped_entries.get(entry["value"], [])
                     grouped_entries[entry["value"]].append(entry)
 
                 # Returns grouped duplicates.
-                return grouped_entries
+                return dict(grouped_entries)
             else:
                 # Returns un-grouped duplicates.
                 return duplicate_list_dictionary
@@ -592,138 +612,95 @@ def get_list_duplicates(
         type_check(value=match_index, required_type=int, tb_remove_name="get_list_duplicates")
     type_check(value=grouped, required_type=bool, tb_remove_name="get_list_duplicates")
 
-    formatted_duplicates = "  - duplicates (list):" + str("\n        - " + "\n        - ".join(map(str, duplicates)))
-    if match_index:
-        formatted_match_index = f"  - match_index (int):\n        - {match_index}"
+    # Skips building the parameter output when debug logging is disabled.
+    if logger.isEnabledFor(logging.DEBUG):
+        formatted_duplicates = "  - duplicates (list):\n        - " + "\n        - ".join(map(str, duplicates))
+        formatted_match_index = f"  - match_index (int):\n        - {match_index or None}"
+        logger.debug(
+            "Passing parameters:\n"
+            f"{formatted_duplicates}\n"
+            f"{formatted_match_index}\n"
+            f"  - grouped (bool):\n        - {grouped}\n"
+        )
+
+    # Stores every index point for each matching value.
+    # The key is the matching value from the list and the value is the list of index points.
+    value_indexes: defaultdict[Any, list[int]] = defaultdict(list)
+    # Stores the index points for matching values that can not be hashed (ex: dict).
+    unhashable_value_indexes: list[tuple[Any, list[int]]] = []
+    # Stores the index points of each duplicate in the order the duplicate was discovered.
+    duplicate_indexes: list[list[int]] = []
+
+    # Sets how list entries get matched.
+    # The match_index is the same for every entry, so the check is done once and not repeated in the loops.
+    is_index_match: bool
+    get_list_match_value: Callable[[Any], Any]
+    # Checks if a match_index is given to match a specific index in the list entry.
+    if isinstance(match_index, int):
+        is_index_match = True
+        # Binds the int match_index for indexing list entries in the loops.
+        index_to_match: int = match_index
+        get_list_match_value = itemgetter(index_to_match)
+    # No match_index given, so the entire list entry will be used for matching.
     else:
-        formatted_match_index = f"  - match_index (int):\n        - None"
-    logger.debug(
-        "Passing parameters:\n"
-        f"{formatted_duplicates}\n"
-        f"{formatted_match_index}\n"
-        f"  - grouped (bool):\n        - {grouped}\n"
-    )
+        is_index_match = False
+        get_list_match_value = _list_entry_key
 
-    # Temporary storage for unique items.
-    temp_unique_items = []
-    # Stores duplicate list entries as dictionaries.
-    # The key is the duplicate from the list and the value is the index.
-    duplicate_list_dictionary = []
-
-    for entry in duplicates:
+    # Loops through all entries once.
+    for index, entry in enumerate(duplicates):
         # Checks if the entry in the list is another list.
         # This allows lists to be in a list and be searched.
-        if isinstance(entry, list) or isinstance(entry, tuple):
-            # Checks that a match_index is given to match a specific index in the list entry.
-            if isinstance(match_index, int):
-                # Checks if the entry from the list exists in the "temp_unique_items" list. If not it gets added to the temp list.
-                # If the entry exists the entry will hit the elif statement and get all index points for the duplicates.
-                if entry[match_index] not in temp_unique_items:
-                    # Adds the entry to the list.
-                    temp_unique_items.append(entry[match_index])
-                # Checks if the duplicate entry already exists in the duplicate_list_dictionary list.
-                # This has to check if the 'duplicate_list_dictionary' is empty and if the duplicate list does not contain the entry.
-                # The two different "entry" searches are required in case the key is a string or an INT. A string would have a single quote and an INT would not.
-                elif (
-                    bool(duplicate_list_dictionary) is False
-                    or f"'value': {entry[match_index]}" not in str(duplicate_list_dictionary)
-                    and f"'value': '{entry[match_index]}'" not in str(duplicate_list_dictionary)
-                ):
-                    # Loops through all entries in the list.
-                    for index, value in enumerate(duplicates):
-                        # Checks if the value from the list is equal to the discovered duplicate.
-                        if value[match_index] == entry[match_index]:
-                            # Adds the duplicate entry values and index
-                            # The value will be the key and the index will be the value.
-                            # This will allow the ease if finding all index points for a specific value.
-                            duplicate_list_dictionary.append({"index": index, "value": value})
-            # No match_index given, so the entire list entry will be used for matching, so the entry will be converted to a string.
-            else:
-                # Checks if the entry from the list exists in the "temp_unique_items" list. If not it gets added to the temp list.
-                # If the entry exists the entry will hit the elif statement and get all index points for the duplicates.
-                if str(entry) not in temp_unique_items:
-                    # Adds the entry to the list.
-                    temp_unique_items.append(str(entry))
-                # Checks if the duplicate entry already exists in the duplicate_list_dictionary list.
-                # This has to check if the 'duplicate_list_dictionary' is empty and if the duplicate list does not contain the entry.
-                # The two different "entry" searches are required in case the key is a string or an INT. A string would have a single quote and an INT would not.
-                elif (
-                    bool(duplicate_list_dictionary) is False
-                    or f"'value': {str(entry)}" not in str(duplicate_list_dictionary)
-                    and f"'value': '{str(entry)}'" not in str(duplicate_list_dictionary)
-                ):
-                    # Loops through all entries in the list.
-                    for index, value in enumerate(duplicates):
-                        # Checks if the value from the list is equal to the discovered duplicate.
-                        if str(value) == str(entry):
-                            # Adds the duplicate entry values and index
-                            # The value will be the key and the index will be the value.
-                            # This will allow the ease if finding all index points for a specific value.
-                            duplicate_list_dictionary.append({"index": index, "value": value})
+        if isinstance(entry, (list, tuple)):
+            match_value = get_list_match_value(entry)
         # Standard strings in the list.
         else:
-            # Checks if the entry from the list exists in the "temp_unique_items" list. If not it gets added to the temp list.
-            # If the entry exists the entry will hit the elif statement and get all index points for the duplicates.
-            if entry not in temp_unique_items:
-                # Adds the entry to the list.
-                temp_unique_items.append(entry)
-            # Checks if the duplicate entry already exists in the duplicate_list_dictionary list.
-            # This has to check if the 'duplicate_list_dictionary' is empty and if the duplicate list does not contain the entry.
-            # The two different "entry" searches are required in case the key is a string or an INT. A string would have a single quote and an INT would not.
-            elif (
-                bool(duplicate_list_dictionary) is False
-                or f"'value': {entry}" not in str(duplicate_list_dictionary)
-                and f"'value': '{entry}'" not in str(duplicate_list_dictionary)
-            ):
-                # Loops through all entries in the list.
-                for index, value in enumerate(duplicates):
-                    # Checks if the value from the list is equal to the discovered duplicate.
-                    if value == entry:
-                        # Adds the duplicate entry values and index
-                        # The value will be the key and the index will be the value.
-                        # This will allow the ease if finding all index points for a specific value.
-                        duplicate_list_dictionary.append({"index": index, "value": value})
+            match_value = entry
+
+        try:
+            indexes = value_indexes[match_value]
+        except TypeError:
+            indexes = _get_unhashable_indexes(unhashable_value_indexes, match_value)
+        indexes.append(index)
+        # The second index point means the value is a duplicate.
+        if len(indexes) == 2:
+            duplicate_indexes.append(indexes)
+
+    # Stores duplicate list entries as dictionaries.
+    # The key is the duplicate from the list and the value is the index.
+    duplicate_list_dictionary = [
+        {"index": index, "value": duplicates[index]} for indexes in duplicate_indexes for index in indexes
+    ]
 
     # Checks that duplicates exist.
     if duplicate_list_dictionary:
         # Checks if the user enabled grouping.
         if grouped:
             # Stores new grouped entries
-            grouped_entries: dict[str, list[Any]] = {}
+            grouped_entries: defaultdict[str, list[Any]] = defaultdict(list)
             # Loops through each grouped entry.
             for entry in duplicate_list_dictionary:
                 # Checks if the match_index is set to match a specific list index in the list entry.
-                if isinstance(match_index, int):
+                if is_index_match:
                     # Checks if the values being returned are a tuple.
                     # If tuple the matched_index will be used to set the key.
                     # This is required because single value will be a string and the index will only pull the first letter.
                     # Output Example: {'index': 0, 'value': ('ValueA', 'ValueB')}
                     if isinstance(entry["value"], tuple):
                         # Gets matching entries based on the "value" key and adds them to the grouped dictionary.
-                        grouped_entries[str(entry["value"][match_index])] = grouped_entries.get(
-                            str(entry["value"][match_index]), []
-                        )
-                        grouped_entries[str(entry["value"][match_index])].append(entry)
+                        grouped_entries[str(entry["value"][index_to_match])].append(entry)
                     # Means only one entry exists as the value, and the value type is a string.
                     # Output Example: {'index': 3, 'value': 'ValueB'}
                     else:
                         # Gets matching entries based on the "value" key and adds them to the grouped dictionary.
-                        grouped_entries[str(entry["value"])] = grouped_entries.get(str(entry["value"]), [])
                         grouped_entries[str(entry["value"])].append(entry)
-                # Checks if no match_index exists, which matches the entire list entry.
+                # No match_index exists, which matches the entire list entry.
                 # The list entry is converted to a string for the key.
-                elif not isinstance(match_index, int):
-                    # Gets matching entries based on the "value" key and adds them to the grouped dictionary.
-                    grouped_entries[str(entry["value"])] = grouped_entries.get(str(entry["value"]), [])
-                    grouped_entries[str(entry["value"])].append(entry)
-                # Standard string element in the list.
                 else:
                     # Gets matching entries based on the "value" key and adds them to the grouped dictionary.
-                    grouped_entries[entry["value"]] = grouped_entries.get(entry["value"], [])
-                    grouped_entries[entry["value"]].append(entry)
+                    grouped_entries[str(entry["value"])].append(entry)
 
             # Returns grouped duplicates.
-            return grouped_entries
+            return dict(grouped_entries)
         else:
             # Returns un-grouped duplicates.
             return duplicate_list_dictionary
@@ -766,9 +743,10 @@ def sort_list(my_list: list[Any]) -> list[Any]:
 
     type_check(value=my_list, required_type=list, tb_remove_name="sort_list")
 
-    formatted_my_list = "  - my_list (list):" + str("\n        - " + "\n        - ".join(map(str, my_list)))
-
-    logger.debug("Passing parameters:\n" f"{formatted_my_list}\n")
+    # Skips building the parameter output when debug logging is disabled.
+    if logger.isEnabledFor(logging.DEBUG):
+        formatted_my_list = "  - my_list (list):\n        - " + "\n        - ".join(map(str, my_list))
+        logger.debug("Passing parameters:\n" f"{formatted_my_list}\n")
 
     # Stores the original type, so it can be converted back.
     orig_type: dict[Any, Any] = {}
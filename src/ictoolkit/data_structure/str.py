@@ -62,7 +62,7 @@ def list_to_str(value: Union[str, list], sep: str = " ") -> str:
     if isinstance(value, str):
         formatted_value = f"  - string (str):\n        - {value}\n"
     else:
-        formatted_value = "  - value (list):" + str("\n        - " + "\n        - ".join(map(str, value)))
+        formatted_value = "  - value (list):\n        - " + "\n        - ".join(map(str, value))
     logger.debug("Passing parameters:\n" f"{formatted_value}\n")
 
     if isinstance(value, list):
@@ -251,9 +251,7 @@ def remove_section(orig_value: str, removal_values: Union[str, tuple[str, ...]],
     type_check(value=sep, required_type=str, tb_remove_name="remove_section")
     type_check(value=percent, required_type=int, tb_remove_name="remove_section")
 
-    formatted_removal_values = "  - removal_values (list):" + str(
-        "\n        - " + "\n        - ".join(map(str, removal_values))
-    )
+    formatted_removal_values = "  - removal_values (list):\n        - " + "\n        - ".join(map(str, removal_values))
     logger.debug(
         "Passing parameters:\n"
         f"  - orig_value (str):\n        - {orig_value}\n"
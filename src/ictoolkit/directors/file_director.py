@@ -187,12 +187,12 @@ def search_file(
     type_check(value=searching_value, required_type=(str, list), tb_remove_name="search_file")
 
     if isinstance(file_path, list):
-        formatted_file_path = "  - file_path (list):" + str("\n        - " + "\n        - ".join(map(str, file_path)))
+        formatted_file_path = "  - file_path (list):\n        - " + "\n        - ".join(map(str, file_path))
     elif isinstance(file_path, str):
         formatted_file_path = f"  - file_path (str):\n        - {file_path}"
     if isinstance(searching_value, list):
-        formatted_searching_value = "  - searching_value (list):" + str(
-            "\n        - " + "\n        - ".join(map(str, searching_value))
+        formatted_searching_value = "  - searching_value (list):\n        - " + "\n        - ".join(
+            map(str, searching_value)
         )
     elif isinstance(searching_value, str):
         formatted_searching_value = f"  - searching_value (str):\n        - {searching_value}"
@@ -288,7 +288,7 @@ def search_file(
                             if found is False:
                                 break
                     matched_entries.append(
-                        {"search_entry": searching_value, "found_entry": str("\n".join(multi_line_builder))}
+                        {"search_entry": searching_value, "found_entry": "\n".join(multi_line_builder)}
                     )
                 else:
                     # Adds found line and search value to list
@@ -326,7 +326,7 @@ def search_file(
                                 if found is False:
                                     break
                         matched_entries.append(
-                            {"search_entry": searching_value, "found_entry": str("\n".join(multi_line_builder))}
+                            {"search_entry": searching_value, "found_entry": "\n".join(multi_line_builder)}
                         )
                     else:
                         # Adds found line and search value to list
@@ -88,8 +88,8 @@ def start_subprocess(program_arguments: Union[str, list]) -> AttributeDictionary
     type_check(value=program_arguments, required_type=(str, list), tb_remove_name="start_subprocess")
 
     if isinstance(program_arguments, list):
-        formatted_program_arguments = "  - program_arguments (list):" + str(
-            "\n        - " + "\n        - ".join(map(str, program_arguments))
+        formatted_program_arguments = "  - program_arguments (list):\n        - " + "\n        - ".join(
+            map(str, program_arguments)
         )
     elif isinstance(program_arguments, str):
         formatted_program_arguments = f"  - program_arguments (str):\n        - {program_arguments}"
@@ -368,3 +368,44 @@ def test_1_5_string_grouper():
     assert ("KV-MDF", ["KV-MDF-9200-1_2", "KV-MDF1-9200-1_2"]) == list(group_check.items())[2]
     assert ("KZV-MDF1-9200-1_2", ["KZV-MDF1-9200-1_2"]) == list(group_check.items())[3]
     assert ("TI-IDF", ["TI-IDF1-9200-1_2", "TI-IDF2-9200-1_2"]) == list(group_check.items())[4]
+
+
+def test_1_6_string_grouper():
+    """
+    Tests grouping strings.
+
+    Option: 1
+    """
+    # The "KV+1" entry sorts between the two "KV" group entries.
+    list_of_strings = [
+        "KV",
+        "KV-1",
+        "KV+1",
+    ]
+
+    group_check = string_grouper(list_of_strings=list_of_strings, grouping_value="-", grouping_option=1)
+
+    assert 2 == len(group_check.items())
+    assert ("KV", ["KV", "KV-1"]) == list(group_check.items())[0]
+    assert ("KV+1", ["KV+1"]) == list(group_check.items())[1]
+
+
+def test_1_7_string_grouper():
+    """
+    Tests grouping strings with a character position number less than 1.
+
+    Option: 2
+    """
+    list_of_strings = [
+        "abc",
+        "abd",
+        "xyz",
+    ]
+
+    with pytest.raises(Exception) as excinfo:
+        string_grouper(list_of_strings=list_of_strings, grouping_value=0, grouping_option=2)
+    assert """The grouping_value sent for the grouping is less than 1.""" in str(excinfo.value)
+
+    with pytest.raises(Exception) as excinfo:
+        string_grouper(list_of_strings=list_of_strings, grouping_value=-2, grouping_option=2)
+    assert """The grouping_value sent for the grouping is less than 1.""" in str(excinfo.value)
@@ -222,6 +222,7 @@ def test_remove_duplicate_dict_values_in_list():
     Raises:
         ValueError: A failure occurred in section 1.0 while testing the function 'remove_duplicate_dict_values_in_list' using a full check.
         ValueError: A failure occurred in section 1.1 while testing the function 'remove_duplicate_dict_values_in_list' using an index.
+        ValueError: A failure occurred in section 1.2 while testing the function 'remove_duplicate_dict_values_in_list' using index 0.
     """
     print("")
     print("-" * 65)
@@ -267,6 +268,19 @@ def test_remove_duplicate_dict_values_in_list():
         }
         raise FValueError(exc_args)
 
+    # ========Tests for a successful output return.========
+    # Tests removing duplicates from index 0 of each dictionary entry.
+    check_index = remove_duplicate_dict_values_in_list(sample_list_dictionary, 0)
+    # Return length should equal 2.
+    # Expected Return: [{'search_entry': '|Error|', 'found_entry': 'the entry found'}, {'search_entry': '|Warning|', 'found_entry': 'the entry found'}]
+    if len(check_index) != 2:
+        exc_args = {
+            "main_message": "A failure occurred in section 1.2 while testing the function 'remove_duplicate_dict_values_in_list' using index 0.",
+            "expected_result": 2,
+            "returned_result": len(check_index),
+        }
+        raise FValueError(exc_args)
+
 
 def test_get_list_of_dicts_duplicates():
     """
@@ -386,3 +400,38 @@ def test_get_list_duplicates():
             "returned_result": len(check_all),
         }
         raise FValueError(exc_args)
+
+
+def test_1_get_list_duplicates():
+    """
+    Tests getting a list of duplicates when one value is a substring of another value.
+    """
+    duplicates = get_list_duplicates(duplicates=[10, 1, 10, 1])
+    assert [
+        {"index": 0, "value": 10},
+        {"index": 2, "value": 10},
+        {"index": 1, "value": 1},
+        {"index": 3, "value": 1},
+    ] == duplicates
+
+
+def test_1_1_get_list_duplicates():
+    """
+    Tests getting a list of duplicates with list entries. Each index point should only return once.
+    """
+    duplicates = get_list_duplicates(duplicates=[["ValueA", "ValueB"], ["ValueA", "ValueB"], ["ValueA", "ValueC"]])
+    assert [
+        {"index": 0, "value": ["ValueA", "ValueB"]},
+        {"index": 1, "value": ["ValueA", "ValueB"]},
+    ] == duplicates
+
+
+def test_1_2_get_list_duplicates():
+    """
+    Tests getting a list of duplicates with unhashable dictionary entries.
+    """
+    duplicates = get_list_duplicates(duplicates=[{"key1": "ValueA"}, {"key1": "ValueB"}, {"key1": "ValueA"}])
+    assert [
+        {"index": 0, "value": {"key1": "ValueA"}},
+        {"index": 2, "value": {"key1": "ValueA"}},
+    ] == duplicates